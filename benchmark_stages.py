@@ -0,0 +1,256 @@
+"""
+Reproducible stage benchmark for the correlation pipeline.
+
+Generates seeded synthetic tick data (see generate_synthetic_ticks.py) and times
+each stage of calculate_correlation_with_timing separately:
+load -> resample_and_fill -> align_series -> correlation (per method),
+across data sizes and frequencies.
+
+Results are saved as JSON. Passing --baseline compares the run against a
+previously saved result and exits with status 1 if any stage got slower than
+the allowed threshold.
+
+Examples:
+    python benchmark_stages.py --sizes 100000 1000000 --output benchmarks/baselines/local.json
+    python benchmark_stages.py --sizes 100000 1000000 --baseline benchmarks/baselines/local.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import scipy
+
+# Add the current directory to path to import the pipeline modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from correlation_analysis import align_series, load_instrument_data, resample_and_fill
+from generate_synthetic_ticks import generate_synthetic_dataset
+
+DEFAULT_SIZES = [100_000, 1_000_000]
+DEFAULT_FREQUENCIES = ['1ms', '1S', '1T', '1H', '1D']
+DEFAULT_METHODS = ['pearson', 'spearman', 'kendall']
+BENCHMARK_PAIR = 'PETR3:VALE3:0.8'
+
+
+def time_call(func, repeats):
+    """
+    Run func() `repeats` times.
+
+    Returns:
+    --------
+    tuple: (last_return_value, list_of_durations_seconds)
+    """
+    durations = []
+    value = None
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        value = func()
+        durations.append(time.perf_counter() - start)
+
+    return value, durations
+
+
+def summarize(durations):
+    """Summary statistics for a list of durations (seconds)."""
+    return {
+        'median': statistics.median(durations),
+        'min': min(durations),
+        'max': max(durations),
+        'runs': len(durations),
+    }
+
+
+def prepare_data(data_root, rows, seed):
+    """Generate the synthetic pair for a given size, reusing it if the manifest matches."""
+    data_dir = os.path.join(data_root, f'rows_{rows}_seed_{seed}')
+    manifest_path = os.path.join(data_dir, 'manifest.json')
+
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get('rows') == rows and manifest.get('seed') == seed:
+            print(f"Reusing synthetic data in {data_dir}")
+            return data_dir, manifest
+
+    print(f"Generating synthetic data ({rows:,} rows per instrument) in {data_dir}")
+    manifest = generate_synthetic_dataset(output_dir=data_dir, pairs_spec=BENCHMARK_PAIR, rows=rows, seed=seed)
+    return data_dir, manifest
+
+
+def benchmark_size(data_dir, manifest, frequencies, methods, repeats):
+    """Time every stage for one dataset size. Returns a dict keyed by stage id."""
+    pair = manifest['pairs'][0]
+    instrument1, instrument2 = pair['instrument1'], pair['instrument2']
+    rows = manifest['rows']
+    results = {}
+
+    def load_pair():
+        return (load_instrument_data(instrument1, data_folder=data_dir),
+                load_instrument_data(instrument2, data_folder=data_dir))
+
+    (df1, df2), durations = time_call(load_pair, repeats)
+    results[f'load|{rows}'] = {'stage': 'load', 'rows': rows, **summarize(durations)}
+    print(f"  load: {statistics.median(durations):.4f}s")
+
+    for frequency in frequencies:
+        def resample_pair():
+            return resample_and_fill(df1, frequency), resample_and_fill(df2, frequency)
+
+        (df1_resampled, df2_resampled), durations = time_call(resample_pair, repeats)
+        results[f'resample|{rows}|{frequency}'] = {
+            'stage': 'resample', 'rows': rows, 'frequency': frequency, **summarize(durations)
+        }
+
+        df_combined, durations = time_call(lambda: align_series(df1_resampled, df2_resampled), repeats)
+        results[f'align|{rows}|{frequency}'] = {
+            'stage': 'align', 'rows': rows, 'frequency': frequency,
+            'len_corr_matrix': len(df_combined), **summarize(durations)
+        }
+
+        line = f"  {frequency}: resample={results[f'resample|{rows}|{frequency}']['median']:.4f}s " \
+               f"align={results[f'align|{rows}|{frequency}']['median']:.4f}s"
+
+        for method in methods:
+            correlation_value, durations = time_call(
+                lambda: df_combined['last_1'].corr(df_combined['last_2'], method=method), repeats
+            )
+            results[f'correlation|{rows}|{frequency}|{method}'] = {
+                'stage': 'correlation', 'rows': rows, 'frequency': frequency, 'method': method,
+                'correlation_value': None if pd.isna(correlation_value) else float(correlation_value),
+                'expected_rho': pair['rho'],
+                **summarize(durations)
+            }
+            line += f" {method}={statistics.median(durations):.4f}s"
+
+        print(line)
+
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold, min_delta):
+    """
+    Compare median timings against a baseline.
+
+    A stage is a regression when it is more than `threshold` (fraction) slower
+    than the baseline AND the absolute slowdown exceeds `min_delta` seconds,
+    so sub-millisecond stages do not fail on timer noise.
+
+    Returns:
+    --------
+    list of dicts: One entry per regressed stage
+    """
+    regressions = []
+
+    for key, current in results.items():
+        reference = baseline['results'].get(key)
+        if reference is None:
+            print(f"  (no baseline) {key}")
+            continue
+
+        delta = current['median'] - reference['median']
+        ratio = current['median'] / reference['median'] if reference['median'] > 0 else float('inf')
+
+        if ratio - 1.0 > threshold and delta > min_delta:
+            status = "❌"
+            regressions.append({'key': key, 'baseline': reference['median'],
+                                'current': current['median'], 'ratio': ratio})
+        else:
+            status = "✅"
+
+        print(f"  {status} {key}: {reference['median']:.4f}s -> {current['median']:.4f}s ({ratio:.2f}x)")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark correlation pipeline stages on synthetic data.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Rows per instrument (max 5,000,000)')
+    parser.add_argument('--frequencies', nargs='+', default=DEFAULT_FREQUENCIES, help='Resample frequencies')
+    parser.add_argument('--methods', nargs='+', default=DEFAULT_METHODS, help='Correlation methods')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed runs per stage (median is reported)')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the synthetic data')
+    parser.add_argument('--data-dir', default='benchmarks/data', help='Cache folder for synthetic data')
+    parser.add_argument('--output', default=None,
+                        help='Where to save the results JSON (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--baseline', default=None, help='Baseline JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed slowdown vs baseline as a fraction (0.25 = 25%%)')
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help='Ignore slowdowns smaller than this many seconds')
+
+    args = parser.parse_args()
+
+    output_file = args.output or os.path.join(
+        'benchmarks', 'results', f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+
+    print("=" * 80)
+    print("STAGE BENCHMARK")
+    print("=" * 80)
+    print(f"Sizes: {args.sizes}")
+    print(f"Frequencies: {args.frequencies}")
+    print(f"Methods: {args.methods}")
+    print(f"Repeats: {args.repeats}, Seed: {args.seed}")
+
+    results = {}
+    for rows in args.sizes:
+        print("\n" + "-" * 80)
+        data_dir, manifest = prepare_data(args.data_dir, rows, args.seed)
+        print(f"Benchmarking {rows:,} rows per instrument...")
+        results.update(benchmark_size(data_dir, manifest, args.frequencies, args.methods, args.repeats))
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'config': {
+            'sizes': args.sizes,
+            'frequencies': args.frequencies,
+            'methods': args.methods,
+            'repeats': args.repeats,
+            'seed': args.seed,
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'scipy': scipy.__version__,
+        },
+        'results': results,
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+    with open(output_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Results saved to: {output_file}")
+
+    if args.baseline:
+        print("\n" + "=" * 80)
+        print(f"COMPARING TO BASELINE: {args.baseline}")
+        print("=" * 80)
+
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = compare_to_baseline(results, baseline, args.threshold, args.min_delta)
+
+        if regressions:
+            print(f"\n❌ {len(regressions)} stage(s) regressed more than {args.threshold:.0%}")
+            sys.exit(1)
+
+        print(f"\n✅ No regressions above {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
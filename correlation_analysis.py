@@ -75,6 +75,43 @@ def resample_and_fill(df, frequency):
     return df_resampled
 
 
+def align_series(df1_resampled, df2_resampled):
+    """
+    Align two resampled series into a single dataframe with columns last_1 and last_2.
+
+    Both series are cut to their common time window, outer-joined on the index,
+    rows where neither instrument traded are dropped and prices are forward filled.
+    """
+    # -------------------------------------------------------
+    # ENFORCE COMMON TIME WINDOW (INTERSECTION)
+    # -------------------------------------------------------
+    # Find the latest start time and earliest end time
+    start_common = max(df1_resampled.index.min(), df2_resampled.index.min())
+    end_common = min(df1_resampled.index.max(), df2_resampled.index.max())
+
+    # Filter both to this common window
+    df1_resampled = df1_resampled[(df1_resampled.index >= start_common) & (df1_resampled.index <= end_common)]
+    df2_resampled = df2_resampled[(df2_resampled.index >= start_common) & (df2_resampled.index <= end_common)]
+
+    # -------------------------------------------------------
+    # SYNCHRONIZE TICKS
+    # -------------------------------------------------------
+    # Concatenate the two series side by side (Outer Join on Index)
+    df_combined = pd.concat([df1_resampled, df2_resampled], axis=1)
+    df_combined.columns = ['last_1', 'last_2']
+
+    # Remove "quiet" periods where NEITHER instrument traded
+    # For 1ms: This is redundant (outer join of sparse data won't have all-NaN rows)
+    # For 1T/1S: This removes the minutes/seconds where no trades happened (NaNs)
+    df_combined = df_combined.dropna(how='all')
+
+    # Forward fill to synchronize ticks
+    # If Inst1 trades at t1, use Inst2's last price at or before t1
+    df_combined = df_combined.ffill().bfill()
+
+    return df_combined
+
+
 def calculate_correlation_with_timing(instrument1, instrument2, frequency, correlation_method,
                                       data_folder='transformed_data/instrument_series'):
     """
@@ -108,32 +145,8 @@ def calculate_correlation_with_timing(instrument1, instrument2, frequency, corre
         metrics['len1_resampled'] = len(df1_resampled)
         metrics['len2_resampled'] = len(df2_resampled)
 
-        # -------------------------------------------------------
-        # ENFORCE COMMON TIME WINDOW (INTERSECTION)
-        # -------------------------------------------------------
-        # Find the latest start time and earliest end time
-        start_common = max(df1_resampled.index.min(), df2_resampled.index.min())
-        end_common = min(df1_resampled.index.max(), df2_resampled.index.max())
-
-        # Filter both to this common window
-        df1_resampled = df1_resampled[(df1_resampled.index >= start_common) & (df1_resampled.index <= end_common)]
-        df2_resampled = df2_resampled[(df2_resampled.index >= start_common) & (df2_resampled.index <= end_common)]
-
-        # -------------------------------------------------------
-        # SYNCHRONIZE TICKS
-        # -------------------------------------------------------
-        # Concatenate the two series side by side (Outer Join on Index)
-        df_combined = pd.concat([df1_resampled, df2_resampled], axis=1)
-        df_combined.columns = ['last_1', 'last_2']
-
-        # Remove "quiet" periods where NEITHER instrument traded
-        # For 1ms: This is redundant (outer join of sparse data won't have all-NaN rows)
-        # For 1T/1S: This removes the minutes/seconds where no trades happened (NaNs)
-        df_combined = df_combined.dropna(how='all')
-
-        # Forward fill to synchronize ticks
-        # If Inst1 trades at t1, use Inst2's last price at or before t1
-        df_combined = df_combined.ffill().bfill()
+        # Align both series on a common, synchronized index
+        df_combined = align_series(df1_resampled, df2_resampled)
 
         # Check for remaining NaNs (should be 0)
         nan_count = df_combined.isna().sum().sum()
@@ -0,0 +1,254 @@
+"""
+Generate seeded synthetic B3 tick data in the transformed layout.
+
+Writes <INSTRUMENT>_transformed.csv files (datetime index, instrument, last)
+that load_instrument_data() reads, so run_local_poc.py, test_mock and the
+benchmark suite can run without the cluster dataset.
+
+Each pair of instruments shares a latent price process with a known
+correlation rho; instruments from different pairs are independent (rho = 0).
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+# B3 regular session (matches the trading-hours filter in resample_and_fill)
+SESSION_OPEN_HOUR = 10
+SESSION_CLOSE_HOUR = 17
+SESSION_SECONDS = (SESSION_CLOSE_HOUR - SESSION_OPEN_HOUR) * 3600
+SESSION_MS = SESSION_SECONDS * 1000
+MS_PER_DAY = 24 * 3600 * 1000
+
+DEFAULT_PAIRS = 'PETR3:VALE3:0.8,PETR4:ITUB4:0.3'
+MAX_ROWS = 5_000_000
+
+
+def parse_pairs(pairs_spec):
+    """
+    Parse a pair spec like 'PETR3:VALE3:0.8,PETR4:ITUB4:0.3'.
+
+    Returns:
+    --------
+    list of tuples: [(instrument1, instrument2, rho), ...]
+    """
+    pairs = []
+    seen = set()
+
+    for item in pairs_spec.split(','):
+        item = item.strip()
+        if not item:
+            continue
+
+        parts = item.split(':')
+        if len(parts) != 3:
+            raise ValueError(f"Invalid pair '{item}'. Expected INSTRUMENT1:INSTRUMENT2:RHO")
+
+        instrument1, instrument2, rho = parts[0], parts[1], float(parts[2])
+
+        if not -1.0 <= rho <= 1.0:
+            raise ValueError(f"rho must be in [-1, 1], got {rho} for '{item}'")
+        if instrument1 == instrument2:
+            raise ValueError(f"Pair '{item}' uses the same instrument twice")
+        if instrument1 in seen or instrument2 in seen:
+            raise ValueError(f"Pair '{item}' reuses an instrument; each instrument must belong to one pair")
+
+        seen.update([instrument1, instrument2])
+        pairs.append((instrument1, instrument2, rho))
+
+    if not pairs:
+        raise ValueError("At least one pair is required")
+
+    return pairs
+
+
+def generate_latent_pair(rng, n_steps, rho, half_life_seconds):
+    """
+    Generate two unit-variance stationary AR(1) series with correlation rho.
+
+    Both series share the same AR coefficient and are driven by innovations
+    with correlation rho, so corr(x1, x2) = rho exactly at every lag 0.
+    """
+    phi = 0.5 ** (1.0 / half_life_seconds)
+    scale = np.sqrt(1.0 - phi ** 2)
+
+    z1 = rng.standard_normal(n_steps)
+    z2 = rho * z1 + np.sqrt(1.0 - rho ** 2) * rng.standard_normal(n_steps)
+
+    series = []
+    for z in (z1, z2):
+        shocks = scale * z
+        # Start from the stationary distribution
+        shocks[0] = z[0]
+        series.append(lfilter([1.0], [1.0, -phi], shocks))
+
+    return series[0], series[1]
+
+
+def generate_tick_offsets(rng, n_rows, n_days, burst_mean_size, burst_gap_ms):
+    """
+    Generate n_rows unique tick times as ms offsets from the first session open.
+
+    Ticks arrive in bursts: burst starts follow a U-shaped intraday intensity
+    (busier around the open and the close), burst sizes are geometric and the
+    gaps inside a burst are exponential at the millisecond scale.
+    """
+    offsets = np.empty(0, dtype=np.int64)
+
+    while len(offsets) < n_rows:
+        missing = n_rows - len(offsets)
+        n_bursts = int(np.ceil(missing * 1.2 / burst_mean_size)) + 1
+
+        days = rng.integers(0, n_days, n_bursts)
+        starts = (rng.beta(0.6, 0.6, n_bursts) * SESSION_MS).astype(np.int64)
+        sizes = rng.geometric(1.0 / burst_mean_size, n_bursts)
+
+        # Cumulative ms gaps inside each burst (first tick of a burst at gap 0)
+        gaps = rng.exponential(burst_gap_ms, sizes.sum())
+        burst_first = np.cumsum(sizes) - sizes
+        gaps[burst_first] = 0.0
+        cumulative = np.cumsum(gaps)
+        within = cumulative - np.repeat(cumulative[burst_first], sizes)
+
+        intraday = np.repeat(starts, sizes) + within.astype(np.int64)
+        intraday = np.clip(intraday, 0, SESSION_MS - 1)
+
+        new_offsets = np.repeat(days, sizes).astype(np.int64) * MS_PER_DAY + intraday
+        # One tick per ms, as in the ETL deduplication
+        offsets = np.union1d(offsets, new_offsets)
+
+    if len(offsets) > n_rows:
+        offsets = np.sort(rng.choice(offsets, n_rows, replace=False))
+
+    return offsets
+
+
+def generate_instrument_frame(instrument, latent, session_days, offsets, base_price,
+                              volatility, tick_size):
+    """Sample the latent process at tick times and build a transformed dataframe."""
+    day_index = offsets // MS_PER_DAY
+    intraday_ms = offsets % MS_PER_DAY
+
+    # Latent grid is one step per session second, sessions concatenated
+    latent_index = day_index * SESSION_SECONDS + intraday_ms // 1000
+    prices = base_price * (1.0 + volatility * latent[latent_index])
+    prices = np.round(prices / tick_size) * tick_size
+
+    session_open = session_days[day_index] + pd.Timedelta(hours=SESSION_OPEN_HOUR)
+    timestamps = session_open + pd.to_timedelta(intraday_ms, unit='ms')
+
+    df = pd.DataFrame({'instrument': instrument, 'last': np.round(prices, 2)},
+                      index=pd.DatetimeIndex(timestamps, name='datetime'))
+    return df
+
+
+def generate_synthetic_dataset(output_dir='transformed_data/instrument_series', pairs_spec=DEFAULT_PAIRS,
+                               rows=200_000, ticks_per_day=50_000, start_date='2024-01-02', seed=42,
+                               burst_mean_size=4.0, burst_gap_ms=3.0, half_life_seconds=300.0,
+                               volatility=0.02, tick_size=0.01):
+    """
+    Generate and save synthetic transformed tick files for every instrument in pairs_spec.
+
+    Parameters:
+    -----------
+    output_dir : str
+        Folder where <INSTRUMENT>_transformed.csv files are written
+    pairs_spec : str
+        Comma-separated INSTRUMENT1:INSTRUMENT2:RHO entries
+    rows : int
+        Number of ticks per instrument (up to 5M)
+    ticks_per_day : int
+        Average ticks per session, determines the number of trading days
+    seed : int
+        Seed for numpy's random generator; same seed gives identical files
+
+    Returns:
+    --------
+    dict : Manifest describing the generated dataset (also saved as manifest.json)
+    """
+    if not 2 <= rows <= MAX_ROWS:
+        raise ValueError(f"rows must be between 2 and {MAX_ROWS:,}, got {rows}")
+
+    pairs = parse_pairs(pairs_spec)
+    rng = np.random.default_rng(seed)
+
+    n_days = max(1, int(np.ceil(rows / ticks_per_day)))
+    session_days = pd.bdate_range(start=start_date, periods=n_days)
+    n_steps = n_days * SESSION_SECONDS
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest = {
+        'seed': seed,
+        'rows': rows,
+        'ticks_per_day': ticks_per_day,
+        'trading_days': n_days,
+        'start': str(session_days[0].date()),
+        'end': str(session_days[-1].date()),
+        'session': f'{SESSION_OPEN_HOUR:02d}:00-{SESSION_CLOSE_HOUR:02d}:00',
+        'burst_mean_size': burst_mean_size,
+        'burst_gap_ms': burst_gap_ms,
+        'half_life_seconds': half_life_seconds,
+        'volatility': volatility,
+        'pairs': [],
+    }
+
+    for instrument1, instrument2, rho in pairs:
+        latent1, latent2 = generate_latent_pair(rng, n_steps, rho, half_life_seconds)
+
+        for instrument, latent in ((instrument1, latent1), (instrument2, latent2)):
+            base_price = float(np.round(rng.uniform(10, 60), 2))
+            offsets = generate_tick_offsets(rng, rows, n_days, burst_mean_size, burst_gap_ms)
+            df = generate_instrument_frame(instrument, latent, session_days, offsets,
+                                           base_price, volatility, tick_size)
+
+            csv_path = os.path.join(output_dir, f'{instrument}_transformed.csv')
+            df.to_csv(csv_path, index=True)
+            print(f"Saved {len(df):,} rows for {instrument} → {csv_path}")
+
+        manifest['pairs'].append({'instrument1': instrument1, 'instrument2': instrument2, 'rho': rho})
+
+    with open(os.path.join(output_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate seeded synthetic tick data in the transformed layout.')
+    parser.add_argument('--output-dir', default='transformed_data/instrument_series', help='Output folder')
+    parser.add_argument('--pairs', default=DEFAULT_PAIRS,
+                        help='Comma-separated INSTRUMENT1:INSTRUMENT2:RHO entries')
+    parser.add_argument('--rows', type=int, default=200_000, help=f'Ticks per instrument (max {MAX_ROWS:,})')
+    parser.add_argument('--ticks-per-day', type=int, default=50_000, help='Average ticks per trading session')
+    parser.add_argument('--start-date', default='2024-01-02', help='First trading day (YYYY-MM-DD)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--burst-size', type=float, default=4.0, help='Mean ticks per ms-level burst')
+    parser.add_argument('--burst-gap-ms', type=float, default=3.0, help='Mean gap between ticks in a burst (ms)')
+    parser.add_argument('--half-life', type=float, default=300.0,
+                        help='Mean-reversion half-life of the latent price (seconds)')
+
+    args = parser.parse_args()
+
+    manifest = generate_synthetic_dataset(
+        output_dir=args.output_dir,
+        pairs_spec=args.pairs,
+        rows=args.rows,
+        ticks_per_day=args.ticks_per_day,
+        start_date=args.start_date,
+        seed=args.seed,
+        burst_mean_size=args.burst_size,
+        burst_gap_ms=args.burst_gap_ms,
+        half_life_seconds=args.half_life,
+    )
+
+    print(f"\n✅ Generated {len(manifest['pairs'])} pairs over {manifest['trading_days']} trading days "
+          f"({manifest['start']} → {manifest['end']})")
+
+
+if __name__ == "__main__":
+    main()